@@ -2592,6 +2592,74 @@ tests are run...).
     ...Ran 1 test...
     OK
 
+    >>> iterated = []
+    >>> class IterationLoggingList(list):
+    ...     def __iter__(self):
+    ...         iterated.append(self)
+    ...         return super(IterationLoggingList, self).__iter__()
+    ...
+    >>> called_for = []
+    >>> def callable_source(test_cls):
+    ...     called_for.append(test_cls.__name__)
+    ...     return [3]
+    ...
+    >>> shared_plain = paramseq(IterationLoggingList([1, 2]))
+    >>> shared_with_callable = paramseq(callable_source)
+    >>> @expand
+    ... class TestSharedSources(unittest.TestCase):
+    ...
+    ...     @foreach(shared_plain)
+    ...     def test_a(self, x):
+    ...         pass
+    ...
+    ...     @foreach(shared_plain)
+    ...     def test_b(self, x):
+    ...         pass
+    ...
+    ...     @foreach(shared_with_callable)
+    ...     def test_c(self, x):
+    ...         pass
+    ...
+    ...     @foreach(shared_with_callable)
+    ...     def test_d(self, x):
+    ...         pass
+    ...
+    >>> len(iterated)  # (plain source: params generated once, then reused)
+    1
+    >>> called_for     # (callable source: called for each test method)
+    ['TestSharedSources', 'TestSharedSources']
+    >>> run_tests(TestSharedSources)  # doctest: +ELLIPSIS
+    test_a__<1> ... ok
+    test_a__<2> ... ok
+    test_b__<1> ... ok
+    test_b__<2> ... ok
+    test_c__<3> ... ok
+    test_d__<3> ... ok
+    ...Ran 6 tests...
+    OK
+
+    >>> mutable_arg = []
+    >>> param_with_mutable_arg = param(mutable_arg)
+    >>> @expand
+    ... class TestBefore(unittest.TestCase):
+    ...
+    ...     @foreach([param_with_mutable_arg])
+    ...     def test(self, arg):
+    ...         pass
+    ...
+    >>> mutable_arg.append(1)
+    >>> @expand
+    ... class TestAfter(unittest.TestCase):
+    ...
+    ...     @foreach([param_with_mutable_arg])
+    ...     def test(self, arg):
+    ...         pass
+    ...
+    >>> [name for name in dir(TestBefore) if name.startswith('test__')]
+    ['test__<[]>']
+    >>> [name for name in dir(TestAfter) if name.startswith('test__')]
+    ['test__<[1]>']
+
     >>> @expand
     ... class TestWithWrongContext(unittest.TestCase):
     ...
@@ -2619,74 +2687,89 @@ _PY3 = (sys.version_info[0] >= 3)
 _PY3_11_OR_NEWER = (sys.version_info[:2] >= (3, 11))
 _PY3_7_OR_OLDER = (sys.version_info[:2] <= (3, 7))
 
-if _PY3:
-    if _PY3_11_OR_NEWER:
-        __doc__ = __doc__.replace(
-            '<EXCEPTION WHEN NOT-A-CONTEXT-MANAGER GIVEN>',
-            "TypeError: ...does not support the context manager protocol...")
+if __doc__ is not None:  # (it is None if Python runs with -OO)
+    if _PY3:
+        if _PY3_11_OR_NEWER:
+            __doc__ = __doc__.replace(
+                '<EXCEPTION WHEN NOT-A-CONTEXT-MANAGER GIVEN>',
+                "TypeError: ...does not support the context manager protocol...")
+        else:
+            __doc__ = __doc__.replace(
+                '<EXCEPTION WHEN NOT-A-CONTEXT-MANAGER GIVEN>',
+                'AttributeError: ...__enter__...')
+
+        __doc__ += """
+        >>> @expand
+        ... class Test_is_even(unittest.TestCase):
+        ...
+        ...     # (let's also cover test methods whose signatures include
+        ...     # *various kinds of arguments* and *type annotations*...)
+        ...
+        ...     @foreach(
+        ...         param(-14, expected=True),
+        ...         param(-1, expected=False),
+        ...         param(0, expected=True),
+        ...         param(2, expected=True),
+        ...         param(17, expected=False),
+        ...     )
+        ...     def test_is_even(self, n, *, expected, label):
+        ...         actual = is_even(n)
+        ...         self.assertTrue(isinstance(actual, bool))
+        ...         self.assertEqual(actual, expected)
+        ...         self.assertIsInstance(label, str)
+        ...
+        ...     @foreach(
+        ...         param('X', 'Y', 1, 2, '345', n=42),
+        ...         param('X', y='Y', n=42),
+        ...         param('X', y='Y'),
+        ...     )
+        ...     def test_whatever(self, x: str, /, y: str, *args: object, n: int = 42, **kw) -> None:
+        ...         self.assertEqual(x, 'X')
+        ...         self.assertEqual(y, 'Y')
+        ...         self.assertIn(args, [(), (1, 2, '345')])
+        ...         self.assertEqual(n, 42)
+        ...         self.assertTrue(set(_GENERIC_KWARGS).issubset(kw))
+        ...
+        ...     ## FIXME: *accepted generic kwargs* should not include
+        ...     ##        names of detected positional-only parameters
+        ...     # @foreach([param()])
+        ...     # def test_xxx(self, label='tralala', /):
+        ...     #     self.assertEqual(label, 'tralala')
+        ...
+        >>> run_tests(Test_is_even)  # doctest: +ELLIPSIS
+        test_is_even__<-1,expected=False> ... ok
+        test_is_even__<-14,expected=True> ... ok
+        test_is_even__<0,expected=True> ... ok
+        test_is_even__<17,expected=False> ... ok
+        test_is_even__<2,expected=True> ... ok
+        test_whatever__<'X','Y',1,2,'345',n=42> ... ok
+        test_whatever__<'X',n=42,y='Y'> ... ok
+        test_whatever__<'X',y='Y'> ... ok
+        ...Ran 8 tests...
+        OK
+        """
+        if _PY3_7_OR_OLDER:
+            __doc__ = __doc__.replace(
+                'test_whatever(self, x: str, /, y: str, *args',
+                'test_whatever(self, x: str, y: str, *args')
     else:
         __doc__ = __doc__.replace(
             '<EXCEPTION WHEN NOT-A-CONTEXT-MANAGER GIVEN>',
-            'AttributeError: ...__enter__...')
-
-    __doc__ += """
-    >>> @expand
-    ... class Test_is_even(unittest.TestCase):
-    ...
-    ...     # (let's also cover test methods whose signatures include
-    ...     # *various kinds of arguments* and *type annotations*...)
-    ...
-    ...     @foreach(
-    ...         param(-14, expected=True),
-    ...         param(-1, expected=False),
-    ...         param(0, expected=True),
-    ...         param(2, expected=True),
-    ...         param(17, expected=False),
-    ...     )
-    ...     def test_is_even(self, n, *, expected, label):
-    ...         actual = is_even(n)
-    ...         self.assertTrue(isinstance(actual, bool))
-    ...         self.assertEqual(actual, expected)
-    ...         self.assertIsInstance(label, str)
-    ...
-    ...     @foreach(
-    ...         param('X', 'Y', 1, 2, '345', n=42),
-    ...         param('X', y='Y', n=42),
-    ...         param('X', y='Y'),
-    ...     )
-    ...     def test_whatever(self, x: str, /, y: str, *args: object, n: int = 42, **kw) -> None:
-    ...         self.assertEqual(x, 'X')
-    ...         self.assertEqual(y, 'Y')
-    ...         self.assertIn(args, [(), (1, 2, '345')])
-    ...         self.assertEqual(n, 42)
-    ...         self.assertTrue(set(_GENERIC_KWARGS).issubset(kw))
-    ...
-    ...     ## FIXME: *accepted generic kwargs* should not include
-    ...     ##        names of detected positional-only parameters
-    ...     # @foreach([param()])
-    ...     # def test_xxx(self, label='tralala', /):
-    ...     #     self.assertEqual(label, 'tralala')
-    ...
-    >>> run_tests(Test_is_even)  # doctest: +ELLIPSIS
-    test_is_even__<-1,expected=False> ... ok
-    test_is_even__<-14,expected=True> ... ok
-    test_is_even__<0,expected=True> ... ok
-    test_is_even__<17,expected=False> ... ok
-    test_is_even__<2,expected=True> ... ok
-    test_whatever__<'X','Y',1,2,'345',n=42> ... ok
-    test_whatever__<'X',n=42,y='Y'> ... ok
-    test_whatever__<'X',y='Y'> ... ok
-    ...Ran 8 tests...
-    OK
-    """
-    if _PY3_7_OR_OLDER:
-        __doc__ = __doc__.replace(
-            'test_whatever(self, x: str, /, y: str, *args',
-            'test_whatever(self, x: str, y: str, *args')
-else:
-    __doc__ = __doc__.replace(
-        '<EXCEPTION WHEN NOT-A-CONTEXT-MANAGER GIVEN>',
-        'AttributeError: ...__exit__...')
+            'AttributeError: ...__exit__...')
+
+        __doc__ += """
+        >>> @expand
+        ... class Test_tuple_parameter(unittest.TestCase):
+        ...
+        ...     @foreach([param((1, 2))])
+        ...     def test(self, (a, b)):
+        ...         self.assertEqual((a, b), (1, 2))
+        ...
+        >>> run_tests(Test_tuple_parameter)  # doctest: +ELLIPSIS
+        test__<(1, 2)> ... ok
+        ...Ran 1 test...
+        OK
+        """
 
 
 try:
@@ -2696,7 +2779,6 @@ except ImportError:
 import functools
 import inspect
 import itertools
-import string
 import types
 import warnings
 
@@ -2713,13 +2795,35 @@ __version__ = '0.4.4'
 
 _CLASS_TYPES = (type,) if _PY3 else (type, types.ClassType)
 _TEXT_STRING_TYPES = (str,) if _PY3 else (str, unicode)
+_PARAM_COLLECTION_ABCS = (
+    collections_abc.Sequence,
+    collections_abc.Set,
+    collections_abc.Mapping,
+)
+_COMMON_PARAM_COLLECTION_TYPES = frozenset([
+    # (the most common types of legal param collections,
+    # allowing to skip the relatively costly ABC checks)
+    list,
+    tuple,
+    dict,
+    set,
+    frozenset,
+])
 
 _PARAMSEQ_OBJS_ATTR = '__attached_paramseq_objs'
 
-_GENERIC_KWARGS = 'context_targets', 'label'
+_COPIED_FUNC_ATTR_NAMES = tuple(
+    # (the attributes functools.wraps() would copy, except the names
+    # -- as they are set separately; see: _copy_func_attrs())
+    name for name in functools.WRAPPER_ASSIGNMENTS
+    if name not in ('__name__', '__qualname__'))
+
+_GENERIC_KWARGS = frozenset([
+    'context_targets',
+    'label',
+])
 
 _DEFAULT_PARAMETRIZED_NAME_PATTERN = '{base_name}__<{label}>'
-_DEFAULT_PARAMETRIZED_NAME_FORMATTER = string.Formatter()
 
 
 if _PY3:
@@ -2761,6 +2865,8 @@ else:
 
 class _DisabledExcSuppressContextManagerWrapper(object):
 
+    __slots__ = '_enter', '_exit'
+
     def __init__(self, cm):
         self._enter, self._exit = _get_context_manager_enter_and_exit(cm)
 
@@ -2774,6 +2880,13 @@ class _DisabledExcSuppressContextManagerWrapper(object):
 
 class _Context(object):
 
+    __slots__ = (
+        '_context_manager_factory',
+        '_enable_exc_suppress',
+        '_args',
+        '_kwargs',
+    )
+
     def __init__(self, context_manager_factory, *args, **kwargs):
         self._context_manager_factory = context_manager_factory
         self._enable_exc_suppress = kwargs.pop(
@@ -2789,15 +2902,22 @@ class _Context(object):
             return _DisabledExcSuppressContextManagerWrapper(cm)
 
 
+_SUBSTITUTE_DIRECT_ATTR_NAMES = frozenset([
+    'actual_object',
+    '__class__',
+    '__call__',
+])
+
+
 class Substitute(object):
 
     def __init__(self, actual_object):
         self.actual_object = actual_object
 
     def __getattribute__(self, name):
-        if name in ('actual_object', '__class__', '__call__'):
-            return super(Substitute, self).__getattribute__(name)
-        return getattr(self.actual_object, name)
+        if name in _SUBSTITUTE_DIRECT_ATTR_NAMES:
+            return object.__getattribute__(self, name)
+        return getattr(object.__getattribute__(self, 'actual_object'), name)
 
     def __dir__(self):
         names = ['actual_object']
@@ -2809,11 +2929,24 @@ class Substitute(object):
 
 class param(object):
 
+    __slots__ = (
+        '_args',
+        '_kwargs_items',
+        '_context_list',
+        '_label_list',
+        '_label',
+        '__weakref__',
+    )
+
     def __init__(self, *args, **kwargs):
         self._args = args
-        self._kwargs = kwargs
+        # (note: keyword arguments are kept as a tuple of items, which
+        # is more compact than a dict -- especially in the most common
+        # case of no keyword arguments, when it is just the empty tuple)
+        self._kwargs_items = tuple(kwargs.items())
         self._context_list = []
         self._label_list = []
+        self._label = None
 
     def context(self, context_manager_factory, *args, **kwargs):
         context = _Context(context_manager_factory, *args, **kwargs)
@@ -2831,85 +2964,121 @@ class param(object):
         return cls(param_item)
 
     @classmethod
-    def _combine_instances(cls, param_instances):
-        new = cls()
-        for param_inst in param_instances:
-            new = new._clone_adding(
-                args=param_inst._args,
-                kwargs=param_inst._kwargs,
-                context_list=param_inst._context_list,
-                # (note: calling _get_label() here!)
-                label_list=[param_inst._get_label()])
+    def _combine_instances(cls, labeled_param_instances,
+                           kwargs_may_conflict=True):
+        # (note: each item of `labeled_param_instances` is a pair:
+        # a `param` instance and its label, i.e., the result of the
+        # instance's _get_label() -- computed beforehand by the caller;
+        # `kwargs_may_conflict` can be set to false by a caller which
+        # ensured that the instances' kwargs cannot conflict)
+        if len(labeled_param_instances) == 1:
+            # (the most common case -- a single @foreach() -- in which
+            # there is nothing to combine, so components can be shared)
+            [(param_inst, label)] = labeled_param_instances
+            new = cls._from_components(
+                param_inst._args, param_inst._kwargs_items,
+                param_inst._context_list, [label])
+            new._label = label
+            return new
+        args = []
+        kwargs_items = []
+        context_list = []
+        label_list = []
+        if kwargs_may_conflict:
+            # (names of the keyword arguments gathered so far)
+            kwarg_names = set()
+        for param_inst, label in labeled_param_instances:
+            args.extend(param_inst._args)
+            if kwargs_may_conflict:
+                cls._verify_no_conflicting_kwargs(
+                    kwarg_names, param_inst._kwargs_items)
+                kwarg_names.update(
+                    key for key, _ in param_inst._kwargs_items)
+            kwargs_items.extend(param_inst._kwargs_items)
+            context_list.extend(param_inst._context_list)
+            label_list.append(label)
+        new = cls._from_components(
+            tuple(args), tuple(kwargs_items), context_list, label_list)
+        # (the label is needed anyway, and the ingredients are at hand)
+        new._label = ', '.join(label_list)
+        return new
+
+    @classmethod
+    def _from_components(cls, args, kwargs_items, context_list, label_list):
+        # (note: the given objects are adopted as they are, i.e.,
+        # without copying them and without any checks)
+        new = cls.__new__(cls)
+        new._args = args
+        new._kwargs_items = kwargs_items
+        new._context_list = context_list
+        new._label_list = label_list
+        new._label = None
         return new
 
-    def _clone_adding(self, args=None, kwargs=None,
-                      context_list=None, label_list=None):
-        new = self.__class__(*self._args, **self._kwargs)
-        new._context_list.extend(self._context_list)
-        new._label_list.extend(self._label_list)
-        if args:
-            new._args += tuple(args)
-        if kwargs:
-            conflicting = frozenset(new._kwargs).intersection(kwargs)
-            if conflicting:
-                raise ValueError(
-                    'conflicting keyword arguments: ' +
-                    ', '.join(sorted(map(repr, conflicting))))
-            new._kwargs.update(kwargs)
+    def _clone_adding(self, context_list=None, label_list=None):
+        new_context_list = self._context_list
+        new_label_list = self._label_list
+        # (note: `+` creates new lists, so the given
+        # ones do not need to be copied beforehand)
         if context_list:
-            new._context_list.extend(context_list)
+            new_context_list = new_context_list + context_list
         if label_list:
-            new._label_list.extend(label_list)
-        return new
+            new_label_list = new_label_list + label_list
+        # (note: the components of a `param` are never mutated after
+        # its creation, so the unchanged ones can be safely shared)
+        return self._from_components(
+            self._args, self._kwargs_items, new_context_list, new_label_list)
+
+    @staticmethod
+    def _verify_no_conflicting_kwargs(kwarg_names, other_kwargs_items):
+        conflicting = [key for key, _ in other_kwargs_items
+                       if key in kwarg_names]
+        if conflicting:
+            raise ValueError(
+                'conflicting keyword arguments: ' +
+                ', '.join(sorted(map(repr, conflicting))))
 
     def _get_context_manager_factory(self):
-        try:
-            return self.__cached_cm_factory
-        except AttributeError:
-            # we need to combine several context managers (from the
-            # contexts), but in Py2.7 there is no contextlib.ExitStack,
-            # and contextlib.nested() is deprecated (for good reasons)
-            # -- so we will just generate and execute the code:
-            src_code = (
-                'import contextlib\n'
-                '@contextlib.contextmanager\n'
-                'def cm_factory():\n'
-                '    context_targets = [None] * len(context_list)\n'
-                '    {enclosing_withs}yield context_targets\n'.format(
-                    # (note: if self._context_list is empty,
-                    # enclosing_withs will be an empty string)
-                    enclosing_withs=''.join(
-                        ('with context_list[{0}]._make_context_manager() '
-                         'as context_targets[{0}]:\n{next_indent}'
-                        ).format(i, next_indent=((8 + 4 * i) * ' '))
-                        for i in range(len(self._context_list)))))
-            # Py2+Py3-compatible substitute of exec in a given namespace
-            code = compile(src_code, '<string>', 'exec')
-            namespace = {'context_list': self._context_list}
-            eval(code, namespace)
-            self.__cached_cm_factory = namespace['cm_factory']
-            return self.__cached_cm_factory
+        make_cm_factory = _get_cm_factory_maker(len(self._context_list))
+        return make_cm_factory(self._context_list)
 
     def _get_label(self):
+        if self._label is not None:
+            # (already set, as this param has been created by this
+            # library -- see: _combine_instances(); labels of other
+            # params are not kept, as reprs of their args may change)
+            return self._label
         if self._label_list:
             return ', '.join(self._label_list)
         else:
             short_repr = self._short_repr
-            args_reprs = (short_repr(val) for val in self._args)
-            kwargs_reprs = ('{}={}'.format(key, short_repr(val))
-                            for key, val in sorted(self._kwargs.items()))
-            return ','.join(itertools.chain(args_reprs, kwargs_reprs))
+            reprs = [short_repr(val) for val in self._args]
+            kwargs_items = self._kwargs_items
+            if len(kwargs_items) > 1:
+                kwargs_items = sorted(kwargs_items)
+            # (note: plain concatenation is noticeably
+            # cheaper than str.format() in this case)
+            reprs.extend(key + '=' + short_repr(val)
+                         for key, val in kwargs_items)
+            return ','.join(reprs)
 
     @staticmethod
     def _short_repr(obj, max_len=16):
         r = repr(obj)
-        if len(r) > max_len:
-            r = '<{}...>'.format(r.lstrip('<')[:max_len-5])
-        return r
+        if len(r) <= max_len:
+            # (the most common case: no truncation needed)
+            return r
+        return '<' + r.lstrip('<')[:max_len-5] + '...>'
 
 
 class paramseq(object):
 
+    __slots__ = (
+        '_param_collections',
+        '_context_list',
+        '__weakref__',
+    )
+
     def __init__(*self_and_args, **kwargs):
         self = self_and_args[0]
         args = self_and_args[1:]
@@ -2966,8 +3135,10 @@ class paramseq(object):
 
     @classmethod
     def _from_param_collections(cls, *param_collections):
+        # (note: the caller is responsible for ensuring that all
+        # `param_collections` are legal parameter collections)
         self = cls.__new__(cls)
-        self._init_with_param_collections(*param_collections)
+        self._init_with_legal_param_collections(*param_collections)
         return self
 
     def _init_with_param_collections(self, *param_collections):
@@ -2976,21 +3147,52 @@ class paramseq(object):
                 raise TypeError(
                     '{!r} is not a legal parameter '
                     'collection'.format(param_col))
-        self._param_collections = param_collections
+        self._init_with_legal_param_collections(*param_collections)
+
+    def _init_with_legal_param_collections(self, *param_collections):
+        self._param_collections = self._flatten_param_collections(
+            param_collections)
         self._context_list = []
 
+    @staticmethod
+    def _flatten_param_collections(param_collections):
+        # (any nested `paramseq` that has no contexts of its own is
+        # replaced with its param collections -- so that, later, the
+        # params do not need to be passed through a chain of nested
+        # generators; note that such a nested `paramseq`'s collections
+        # have already been flattened when it was created)
+        flattened = []
+        for param_col in param_collections:
+            if isinstance(param_col, paramseq) and not param_col._context_list:
+                flattened.extend(param_col._param_collections)
+            else:
+                flattened.append(param_col)
+        return tuple(flattened)
+
     @staticmethod
     def _is_legal_param_collection(obj):
+        if type(obj) in _COMMON_PARAM_COLLECTION_TYPES:
+            return True
+        if isinstance(obj, paramseq):
+            return True
         return (
-            isinstance(obj, (
-                paramseq,
-                collections_abc.Sequence,
-                collections_abc.Set,
-                collections_abc.Mapping)
-            ) and
+            isinstance(obj, _PARAM_COLLECTION_ABCS) and
             not isinstance(obj, _TEXT_STRING_TYPES)
         ) or callable(obj)
 
+    def _depends_on_test_cls(self):
+        # (only callable param collections can make use of `test_cls`
+        # -- and, generally, each call may produce different params)
+        for param_col in self._param_collections:
+            if isinstance(param_col, paramseq):
+                if param_col._depends_on_test_cls():
+                    return True
+            elif isinstance(param_col, collections_abc.Mapping):
+                pass
+            elif callable(param_col):
+                return True
+        return False
+
     def _generate_params(self, test_cls):
         for param_inst in self._generate_raw_params(test_cls):
             if self._context_list:
@@ -3081,19 +3283,24 @@ def _expand_test_methods(test_cls):
 
 def _get_attrs_to_substitute_and_add(test_cls):
     attr_names = dir(test_cls)
-    seen_names = set(attr_names)
     attrs_to_substitute = dict()
     attrs_to_add = dict()
+    to_be_parametrized = []
     for base_name in attr_names:
         obj = getattr(test_cls, base_name, None)
         base_func = _get_base_func(obj)
         if base_func is not None:
+            to_be_parametrized.append((base_name, obj, base_func))
+    if to_be_parametrized:
+        seen_names = _new_seen_names(attr_names)
+        labeled_params_cache = dict()
+        for base_name, obj, base_func in to_be_parametrized:
             paramseq_objs = _get_paramseq_objs(base_func)
             accepted_generic_kwargs = _get_accepted_generic_kwargs(base_func)
             for func in _generate_parametrized_functions(
                     test_cls, paramseq_objs,
                     base_name, base_func, seen_names,
-                    accepted_generic_kwargs):
+                    accepted_generic_kwargs, labeled_params_cache):
                 attrs_to_add[func.__name__] = func
             attrs_to_substitute[base_name] = obj
     return attrs_to_substitute, attrs_to_add
@@ -3114,7 +3321,7 @@ def _get_paramseq_objs(base_func):
 
 def _get_accepted_generic_kwargs(base_func):
     accepted_generic_kwargs = _obtain_accepted_generic_kwargs_from(base_func)
-    assert isinstance(accepted_generic_kwargs, set)
+    assert isinstance(accepted_generic_kwargs, frozenset)
     return accepted_generic_kwargs
 
 if _PY3:
@@ -3125,12 +3332,24 @@ if _PY3:
         return obj
 
     def _obtain_accepted_generic_kwargs_from(base_func):
-        spec = inspect.getfullargspec(base_func)
-        accepted_generic_kwargs = set(
-            _GENERIC_KWARGS if spec.varkw is not None
-            else (kw for kw in _GENERIC_KWARGS
-                  if kw in (spec.args + spec.kwonlyargs)))
-        return accepted_generic_kwargs
+        if getattr(base_func, '__signature__', None) is None:
+            # (note: here we inspect the code object directly, as
+            # inspect.getfullargspec() -- being based on the machinery
+            # of inspect.signature() -- is significantly more costly)
+            code = base_func.__code__
+            arg_names = code.co_varnames[
+                :(code.co_argcount + code.co_kwonlyargcount)]
+            accepts_any_kwargs = bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        else:
+            # (the signature has been set explicitly -- so we need to
+            # use getfullargspec(), which, unlike the code object,
+            # takes it into account)
+            spec = inspect.getfullargspec(base_func)
+            arg_names = spec.args + spec.kwonlyargs
+            accepts_any_kwargs = (spec.varkw is not None)
+        if accepts_any_kwargs:
+            return _GENERIC_KWARGS
+        return _GENERIC_KWARGS.intersection(arg_names)
 else:
     def _obtain_base_func_from(obj):
         if not isinstance(obj, types.MethodType):
@@ -3139,11 +3358,12 @@ else:
 
     def _obtain_accepted_generic_kwargs_from(base_func):
         spec = inspect.getargspec(base_func)
-        accepted_generic_kwargs = set(
-            _GENERIC_KWARGS if spec.keywords is not None
-            else (kw for kw in _GENERIC_KWARGS
-                  if kw in spec.args))
-        return accepted_generic_kwargs
+        if spec.keywords is not None:
+            return _GENERIC_KWARGS
+        # (note: here spec.args may contain nested lists -- representing
+        # tuple parameters -- which are unhashable, so we cannot just
+        # make an intersection of _GENERIC_KWARGS and spec.args)
+        return frozenset(kw for kw in _GENERIC_KWARGS if kw in spec.args)
 
 
 def _expand_test_cls(base_test_cls, into):
@@ -3155,7 +3375,8 @@ def _expand_test_cls(base_test_cls, into):
         if not isinstance(base_test_cls, _CLASS_TYPES):
             raise TypeError('{!r} is not a class'.format(base_test_cls))
         into = _resolve_the_into_arg(into, globals_frame_depth=3)
-        seen_names = set(list(into.keys()) + [base_test_cls.__name__])
+        seen_names = _new_seen_names(
+            list(into.keys()) + [base_test_cls.__name__])
         for cls in _generate_parametrized_classes(
                 base_test_cls, paramseq_objs, seen_names):
             into[cls.__name__] = cls
@@ -3178,9 +3399,11 @@ def _resolve_the_into_arg(into, globals_frame_depth):
 
 def _generate_parametrized_functions(test_cls, paramseq_objs,
                                      base_name, base_func, seen_names,
-                                     accepted_generic_kwargs):
+                                     accepted_generic_kwargs,
+                                     labeled_params_cache):
     for count, param_inst in enumerate(
-            _generate_params_from_sources(paramseq_objs, test_cls),
+            _generate_params_from_sources(paramseq_objs, test_cls,
+                                          labeled_params_cache),
             start=1):
         yield _make_parametrized_func(base_name, base_func, count, param_inst,
                                       seen_names, accepted_generic_kwargs)
@@ -3188,63 +3411,210 @@ def _generate_parametrized_functions(test_cls, paramseq_objs,
 
 def _generate_parametrized_classes(base_test_cls, paramseq_objs, seen_names):
     for count, param_inst in enumerate(
-            _generate_params_from_sources(paramseq_objs, base_test_cls),
+            _generate_params_from_sources(paramseq_objs, base_test_cls,
+                                          labeled_params_cache=dict()),
             start=1):
         yield _make_parametrized_cls(base_test_cls, count,
                                      param_inst, seen_names)
 
 
-def _generate_params_from_sources(paramseq_objs, test_cls):
-    src_params_iterables = [
-        ps._generate_params(test_cls)
+def _generate_params_from_sources(paramseq_objs, test_cls,
+                                  labeled_params_cache):
+    # (note: itertools.product() would materialize the sources anyway,
+    # so we do it ourselves -- computing the label of each source param
+    # only once, rather than once per row of the Cartesian product)
+    src_labeled_params = [
+        _get_labeled_params(ps, test_cls, labeled_params_cache)
         for ps in paramseq_objs]
-    for params_row in itertools.product(*src_params_iterables):
-        yield param._combine_instances(params_row)
+    kwargs_may_conflict = _may_kwargs_conflict(src_labeled_params)
+    for labeled_params_row in itertools.product(*src_labeled_params):
+        yield param._combine_instances(labeled_params_row,
+                                       kwargs_may_conflict)
+
+def _may_kwargs_conflict(src_labeled_params):
+    # (if no keyword argument name occurs in params from more than
+    # one source, then no row of the Cartesian product can include
+    # conflicting keyword arguments -- so the per-row check of that
+    # can be skipped)
+    if len(src_labeled_params) < 2:
+        # (the most common case: nothing to conflict with)
+        return False
+    seen_kwarg_names = set()
+    for labeled_params in src_labeled_params:
+        src_kwarg_names = set()
+        for param_inst, _ in labeled_params:
+            src_kwarg_names.update(key for key, _ in param_inst._kwargs_items)
+        if not seen_kwarg_names.isdisjoint(src_kwarg_names):
+            return True
+        seen_kwarg_names.update(src_kwarg_names)
+    return False
+
+
+def _get_labeled_params(ps, test_cls, labeled_params_cache):
+    # (note: foreach() wraps its arguments in a new `paramseq` object
+    # each time, so the cache key is made of the identities of the
+    # param collections and contexts `ps` consists of, rather than of
+    # `ps` itself; those objects are kept alive by the decorated test
+    # functions, so their ids cannot be reused during the expansion)
+    cache_key = (tuple(map(id, ps._param_collections)),
+                 tuple(map(id, ps._context_list)))
+    labeled_params = labeled_params_cache.get(cache_key)
+    if labeled_params is None:
+        labeled_params = [
+            (param_inst, param_inst._get_label())
+            for param_inst in ps._generate_params(test_cls)]
+        if not ps._depends_on_test_cls():
+            # (can be reused for other test methods of the same class)
+            labeled_params_cache[cache_key] = labeled_params
+    return labeled_params
 
 
 def _make_parametrized_func(base_name, base_func, count, param_inst,
                             seen_names, accepted_generic_kwargs):
-    p_args = param_inst._args
-    p_kwargs = param_inst._kwargs
+    args = param_inst._args
+    kwargs_items = param_inst._kwargs_items
+    context_list = param_inst._context_list
     label = param_inst._get_label()
-    cm_factory = param_inst._get_context_manager_factory()
-
-    @functools.wraps(base_func)
-    def generated_func(*args, **kwargs):
-        args += p_args
-        kwargs.update(**p_kwargs)
-        with cm_factory() as context_targets:
-            if 'context_targets' in accepted_generic_kwargs:
-                kwargs.setdefault('context_targets', context_targets)
-            if 'label' in accepted_generic_kwargs:
-                kwargs.setdefault('label', label)
-            return base_func(*args, **kwargs)
-
-    delattr(generated_func, _PARAMSEQ_OBJS_ATTR)
+    make_parametrized_func = _get_parametrized_func_maker(
+        context_count=len(context_list),
+        has_args=bool(args),
+        has_kwargs=bool(kwargs_items),
+        pass_context_targets=('context_targets' in accepted_generic_kwargs),
+        pass_label=('label' in accepted_generic_kwargs))
+    generated_func = make_parametrized_func(
+        base_func, args, kwargs_items, context_list, label)
+    _copy_func_attrs(base_func, generated_func)
     generated_func.__name__ = _format_name_for_parametrized(
         base_name, base_func, label, count, seen_names)
     _set_qualname(base_func, generated_func)
     return generated_func
 
 
+_cm_factory_makers = {}
+
+def _get_cm_factory_maker(context_count):
+    try:
+        return _cm_factory_makers[context_count]
+    except KeyError:
+        # we need to combine several context managers (from the
+        # contexts), but in Py2.7 there is no contextlib.ExitStack,
+        # and contextlib.nested() is deprecated (for good reasons)
+        # -- so we will just generate and execute the code (note:
+        # it depends only on the number of contexts, so it is
+        # compiled only once for each such number)
+        lines = [
+            'import contextlib',
+            'def make_cm_factory(context_list):',
+            '    @contextlib.contextmanager',
+            '    def cm_factory():',
+            '        context_targets = [None] * len(context_list)',
+        ]
+        indent = 8 * ' '
+        for i in range(context_count):
+            lines.append(
+                '{indent}with context_list[{0}]._make_context_manager() '
+                'as context_targets[{0}]:'.format(i, indent=indent))
+            indent += 4 * ' '
+        lines.append(indent + 'yield context_targets')
+        lines.append('    return cm_factory')
+        src_code = '\n'.join(lines) + '\n'
+        # Py2+Py3-compatible substitute of exec in a given namespace
+        code = compile(
+            src_code,
+            '<unittest_expander generated context manager factory>',
+            'exec')
+        namespace = {}
+        eval(code, namespace)
+        make_cm_factory = namespace['make_cm_factory']
+        _cm_factory_makers[context_count] = make_cm_factory
+        return make_cm_factory
+
+
+_parametrized_func_makers = {}
+
+def _get_parametrized_func_maker(context_count, has_args, has_kwargs,
+                                 pass_context_targets, pass_label):
+    shape = (context_count, has_args, has_kwargs,
+             pass_context_targets, pass_label)
+    try:
+        return _parametrized_func_makers[shape]
+    except KeyError:
+        # similarly to _get_cm_factory_maker(), we will
+        # generate and execute the code -- but here the nested `with`
+        # statements are placed directly in the test function (so that
+        # no intermediate compound context manager is involved when a
+        # test is run); the code is specialized for the given shape,
+        # so that no unnecessary operations are performed per call
+        lines = [
+            'def make_parametrized_func(base_func, p_args, p_kwargs_items,',
+            '                           context_list, label):',
+            '    def generated_func(*args, **kwargs):',
+        ]
+        if has_args:
+            lines.append('        args += p_args')
+        if has_kwargs:
+            lines.append('        kwargs.update(p_kwargs_items)')
+        if context_count or pass_context_targets:
+            lines.append(
+                '        context_targets = [None] * len(context_list)')
+        indent = 8 * ' '
+        for i in range(context_count):
+            lines.append(
+                '{indent}with context_list[{0}]._make_context_manager() '
+                'as context_targets[{0}]:'.format(i, indent=indent))
+            indent += 4 * ' '
+        if pass_context_targets:
+            lines.append(
+                indent +
+                "kwargs.setdefault('context_targets', context_targets)")
+        if pass_label:
+            lines.append(indent + "kwargs.setdefault('label', label)")
+        lines.append(indent + 'return base_func(*args, **kwargs)')
+        lines.append('    return generated_func')
+        src_code = '\n'.join(lines) + '\n'
+        # Py2+Py3-compatible substitute of exec in a given namespace
+        code = compile(
+            src_code,
+            '<unittest_expander generated test method>',
+            'exec')
+        namespace = {}
+        eval(code, namespace)
+        make_parametrized_func = namespace['make_parametrized_func']
+        _parametrized_func_makers[shape] = make_parametrized_func
+        return make_parametrized_func
+
+
 def _make_parametrized_cls(base_test_cls, count, param_inst, seen_names):
-    cm_factory = param_inst._get_context_manager_factory()
+    if param_inst._context_list:
+        cm_factory = param_inst._get_context_manager_factory()
+    else:
+        # (no contexts, so there will be nothing to enter and exit)
+        cm_factory = None
     label = param_inst._get_label()
 
     class generated_test_cls(base_test_cls):
 
+        # (set here, as part of the class namespace, rather than
+        # assigned to the created class afterwards)
+        __module__ = base_test_cls.__module__
+
         def setUp(self):
             self.label = label
             self.params = param_inst._args
-            for name, obj in param_inst._kwargs.items():
+            for name, obj in param_inst._kwargs_items:
                 setattr(self, name, obj)
             ready_exit = None
             try:
-                cm = cm_factory()
-                enter, exit = _get_context_manager_enter_and_exit(cm)
-                self.context_targets = enter()
-                ready_exit = exit  # (note: from now on, exit can be called)
-                self.__exit = exit
+                if cm_factory is None:
+                    self.context_targets = []
+                    self.__exit = None
+                else:
+                    cm = cm_factory()
+                    enter, exit = _get_context_manager_enter_and_exit(cm)
+                    self.context_targets = enter()
+                    # (note: from now on, exit can be called)
+                    ready_exit = exit
+                    self.__exit = exit
                 try:
                     super_setUp = super(generated_test_cls, self).setUp
                 except AttributeError:
@@ -3285,7 +3655,6 @@ def _make_parametrized_cls(base_test_cls, count, param_inst, seen_names):
             finally:
                 self.__exit = None
 
-    generated_test_cls.__module__ = base_test_cls.__module__
     generated_test_cls.__name__ = _format_name_for_parametrized(
         base_test_cls.__name__, base_test_cls, label, count, seen_names)
     _set_qualname(base_test_cls, generated_test_cls)
@@ -3295,30 +3664,74 @@ def _make_parametrized_cls(base_test_cls, count, param_inst, seen_names):
 def _format_name_for_parametrized(base_name, base_obj,
                                   label, count, seen_names):
     pattern, formatter = _get_name_pattern_and_formatter()
-    name = stem_name = formatter.format(
-        pattern,
-        base_name=base_name,
-        base_obj=base_obj,
-        label=label,
-        count=count)
-    uniq_tag = 2
-    while name in seen_names:
+    if formatter is not None:
+        name = formatter.format(
+            pattern,
+            base_name=base_name,
+            base_obj=base_obj,
+            label=label,
+            count=count)
+    elif pattern is _DEFAULT_PARAMETRIZED_NAME_PATTERN:
+        # (the most common case, so let's make it fast)
+        name = base_name + '__<' + label + '>'
+    else:
+        # (note: str.format() is equivalent to the format() method of
+        # a string.Formatter instance, but it is implemented in C)
+        name = pattern.format(
+            base_name=base_name,
+            base_obj=base_obj,
+            label=label,
+            count=count)
+    stem_name = name
+    if name in seen_names:
         # ensure that, for a particular class, names are unique
-        name = '{}__{}'.format(stem_name, uniq_tag)
-        uniq_tag += 1
-    seen_names.add(name)
+        # (note: probing starts just after the last uniq tag used
+        # with this stem, as all the previous ones are already taken)
+        uniq_tag = seen_names[stem_name]
+        while name in seen_names:
+            uniq_tag += 1
+            name = '{}__{}'.format(stem_name, uniq_tag)
+        seen_names[stem_name] = uniq_tag
+    seen_names[name] = 1
     return name
 
+def _new_seen_names(names):
+    # (maps each already taken name to the last uniq tag used with
+    # that name as the stem -- see: _format_name_for_parametrized())
+    return dict.fromkeys(names, 1)
+
 def _get_name_pattern_and_formatter():
     pattern = getattr(expand, 'global_name_pattern', None)
     if pattern is None:
         pattern = _DEFAULT_PARAMETRIZED_NAME_PATTERN
+    # (note: if `formatter` is None, str.format() is to be used)
     formatter = getattr(expand, 'global_name_formatter', None)
-    if formatter is None:
-        formatter = _DEFAULT_PARAMETRIZED_NAME_FORMATTER
     return pattern, formatter
 
 
+def _copy_func_attrs(base_func, target_func):
+    # (a lightweight equivalent of functools.wraps() -- except that
+    # __name__ and __qualname__ are not copied, as they are to be set
+    # separately anyway, and that the attached paramseq objects are
+    # not copied, as they must not be attached to the target function)
+    for attr_name in _COPIED_FUNC_ATTR_NAMES:
+        try:
+            value = getattr(base_func, attr_name)
+        except AttributeError:
+            pass
+        else:
+            setattr(target_func, attr_name, value)
+    base_func_dict = base_func.__dict__
+    if len(base_func_dict) > 1:
+        # (typically, the attached paramseq objects are the only
+        # item, so there is nothing to copy)
+        target_func_dict = target_func.__dict__
+        target_func_dict.update(base_func_dict)
+        del target_func_dict[_PARAMSEQ_OBJS_ATTR]
+    if _PY3:
+        target_func.__wrapped__ = base_func
+
+
 def _set_qualname(base_obj, target_obj):
     # relevant to Python 3
     base_qualname = getattr(base_obj, '__qualname__', None)